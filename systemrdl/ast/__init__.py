@@ -24,3 +24,5 @@ from .boolean import BoolAnd, BoolOr
 from .conditional import Conditional
 
 from .cast import WidthCast, BoolCast, AssignmentCast, is_castable
+
+from .folding import fold_constants
@@ -1,6 +1,8 @@
 from copy import deepcopy
-from typing import TYPE_CHECKING, Optional, Any, Dict
+from typing import TYPE_CHECKING, Optional, Any, Dict, List, Tuple, FrozenSet, Type
 
+from .. import rdltypes
+from .. import component as comp
 
 if TYPE_CHECKING:
     from ..compiler import RDLEnvironment
@@ -9,7 +11,57 @@ if TYPE_CHECKING:
 
     OptionalSourceRef = Optional[SourceRefBase]
 
+CopyMembers = Tuple[Tuple[str, ...], Tuple[str, ...]]
+_copy_members = {} # type: Dict[type, CopyMembers]
+
+def get_copy_members(cls: Type['ASTNode']) -> CopyMembers:
+    """
+    Returns the names of all instance attributes of an ASTNode class, split
+    into ones that are copied by reference, and ones that are deepcopied.
+
+    AST nodes use __slots__ instead of a __dict__, so attributes are collected
+    from every class in the MRO.
+    """
+    try:
+        return _copy_members[cls]
+    except KeyError:
+        pass
+    slots = [] # type: List[str]
+    for c in reversed(cls.__mro__):
+        slots.extend(c.__dict__.get("__slots__", ()))
+    copy_by_ref = cls._copy_by_ref
+    members = (
+        tuple(k for k in slots if k in copy_by_ref),
+        tuple(k for k in slots if k not in copy_by_ref),
+    )
+    _copy_members[cls] = members
+    return members
+
+# Member types that are immutable and never need to be copied
+_ATOMIC_TYPES = (type(None), bool, int, str, type)
+
+def clone_value(v: Any, memo: Dict[int, Any]) -> Any:
+    """
+    Deepcopy a member of an AST node.
+
+    Expression trees only store a small set of types, so child nodes and
+    lists of child nodes are cloned directly rather than going through
+    copy.deepcopy()'s generic dispatch. Anything else falls back to it.
+    """
+    if isinstance(v, ASTNode):
+        result = memo.get(id(v))
+        if result is None:
+            result = v.__deepcopy__(memo) # pylint: disable=unnecessary-dunder-call
+        return result
+    if isinstance(v, _ATOMIC_TYPES):
+        return v
+    if isinstance(v, list):
+        return [clone_value(e, memo) for e in v]
+    return deepcopy(v, memo)
+
 class ASTNode:
+    __slots__ = ("env", "msg", "src_ref")
+
     def __init__(self, env: 'RDLEnvironment', src_ref: 'OptionalSourceRef'):
         self.env = env
         self.msg = env.msg
@@ -17,19 +69,21 @@ class ASTNode:
         # Source Ref to use for error context
         self.src_ref = src_ref
 
+    # Members that are copied by reference when deepcopying
+    _copy_by_ref = frozenset(("env", "msg")) # type: FrozenSet[str]
+
     def __deepcopy__(self, memo: Dict[int, Any]) -> 'ASTNode':
         """
         Deepcopy all members except for ones that should be copied by reference
         """
-        copy_by_ref = ["env", "msg"]
         cls = self.__class__
         result = cls.__new__(cls)
         memo[id(self)] = result
-        for k, v in self.__dict__.items():
-            if k in copy_by_ref:
-                setattr(result, k, v)
-            else:
-                setattr(result, k, deepcopy(v, memo))
+        by_ref, cloned = get_copy_members(cls)
+        for k in by_ref:
+            setattr(result, k, getattr(self, k))
+        for k in cloned:
+            setattr(result, k, clone_value(getattr(self, k), memo))
         return result
 
     def predict_type(self) -> 'PreElabRDLType':
@@ -41,6 +95,16 @@ class ASTNode:
         """
         raise NotImplementedError
 
+    def is_pure(self) -> bool:
+        """
+        Returns True if the value of the expression only depends on the
+        expression tree itself.
+
+        Expressions that contain references to parameters or instances are not
+        pure since their value is not known until the tree is elaborated.
+        """
+        return False
+
     def get_min_eval_width(self) -> int:
         """
         Returns the expressions resulting integer width based on the
@@ -68,3 +132,42 @@ class ASTNode:
             Parent expression is propagating the eval_width
         """
         raise NotImplementedError
+
+    def try_constant_fold(self) -> Optional['ASTNode']:
+        """
+        Collapse any constant subexpressions of this node into literals.
+        Operands are replaced in-place.
+
+        Returns a literal that can replace this node if the node itself is
+        constant, otherwise None.
+        """
+        return None
+
+
+def is_castable(src: Any, dst: Any) -> bool:
+    """
+    Check if src type can be cast to dst type
+    """
+    if ((src in [int, bool]) or rdltypes.is_user_enum(src)) and (dst in [int, bool]):
+        # Pure numeric or enum can be cast to a numeric
+        return True
+    elif isinstance(src, rdltypes.ArrayedType) and isinstance(dst, rdltypes.ArrayedType):
+        # Check that array element types also match
+        if src.element_type is None:
+            # indeterminate array type. Is castable
+            return True
+        return is_castable(src.element_type, dst.element_type)
+    elif rdltypes.is_user_struct(dst):
+        # Structs can be assigned their derived counterparts - aka their subclasses
+        return issubclass(src, dst)
+    elif dst == rdltypes.PropertyReference:
+        return issubclass(src, rdltypes.PropertyReference)
+    elif dst == rdltypes.references.RefType:
+        # Any reference
+        if issubclass(src, comp.Component):
+            return True
+        return issubclass(src, rdltypes.PropertyReference)
+    elif src == dst:
+        return True
+    else:
+        return False
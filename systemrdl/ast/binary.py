@@ -1,7 +1,8 @@
 from typing import TYPE_CHECKING, Optional, Type
 
 from .ast_node import ASTNode
-from .conditional import is_castable
+from .cast import is_castable, int_operand
+from .folding import fold_operand
 
 from ..core.helpers import truncate_int
 
@@ -15,6 +16,8 @@ if TYPE_CHECKING:
 #   +  -  *  /  %  &  |  ^  ^~  ~^
 # Normal expression context rules
 class _BinaryIntExpr(ASTNode):
+    __slots__ = ("l", "r")
+
     def __init__(self, env: 'RDLEnvironment', src_ref: 'OptionalSourceRef', l: ASTNode, r: ASTNode):
         super().__init__(env, src_ref)
         self.l = l
@@ -33,8 +36,19 @@ class _BinaryIntExpr(ASTNode):
                 "Right operand of expression is not a compatible numeric type",
                 self.src_ref
             )
+        self.l = int_operand(self.l, l_type)
+        self.r = int_operand(self.r, r_type)
         return int
 
+    def is_pure(self) -> bool:
+        return self.l.is_pure() and self.r.is_pure()
+
+    def try_constant_fold(self) -> Optional[ASTNode]:
+        # Value depends on the width context, so only operands can be folded
+        self.l = fold_operand(self.l)
+        self.r = fold_operand(self.r)
+        return super().try_constant_fold()
+
     def get_min_eval_width(self) -> int:
         return(max(
             self.l.get_min_eval_width(),
@@ -42,35 +56,43 @@ class _BinaryIntExpr(ASTNode):
         ))
 
 class Add(_BinaryIntExpr):
+    __slots__ = ()
+
     def get_value(self, eval_width: Optional[int]=None) -> int:
         if eval_width is None:
             eval_width = self.get_min_eval_width()
-        l = int(self.l.get_value(eval_width))
-        r = int(self.r.get_value(eval_width))
+        l = self.l.get_value(eval_width)
+        r = self.r.get_value(eval_width)
         return truncate_int(l + r, eval_width)
 
 class Sub(_BinaryIntExpr):
+    __slots__ = ()
+
     def get_value(self, eval_width: Optional[int]=None) -> int:
         if eval_width is None:
             eval_width = self.get_min_eval_width()
-        l = int(self.l.get_value(eval_width))
-        r = int(self.r.get_value(eval_width))
+        l = self.l.get_value(eval_width)
+        r = self.r.get_value(eval_width)
         return truncate_int(l - r, eval_width)
 
 class Mult(_BinaryIntExpr):
+    __slots__ = ()
+
     def get_value(self, eval_width: Optional[int]=None) -> int:
         if eval_width is None:
             eval_width = self.get_min_eval_width()
-        l = int(self.l.get_value(eval_width))
-        r = int(self.r.get_value(eval_width))
+        l = self.l.get_value(eval_width)
+        r = self.r.get_value(eval_width)
         return truncate_int(l * r, eval_width)
 
 class Div(_BinaryIntExpr):
+    __slots__ = ()
+
     def get_value(self, eval_width: Optional[int]=None) -> int:
         if eval_width is None:
             eval_width = self.get_min_eval_width()
-        l = int(self.l.get_value(eval_width))
-        r = int(self.r.get_value(eval_width))
+        l = self.l.get_value(eval_width)
+        r = self.r.get_value(eval_width)
 
         if r == 0:
             self.msg.fatal(
@@ -80,11 +102,13 @@ class Div(_BinaryIntExpr):
         return truncate_int(l // r, eval_width)
 
 class Mod(_BinaryIntExpr):
+    __slots__ = ()
+
     def get_value(self, eval_width: Optional[int]=None) -> int:
         if eval_width is None:
             eval_width = self.get_min_eval_width()
-        l = int(self.l.get_value(eval_width))
-        r = int(self.r.get_value(eval_width))
+        l = self.l.get_value(eval_width)
+        r = self.r.get_value(eval_width)
 
         if r == 0:
             self.msg.fatal(
@@ -94,33 +118,41 @@ class Mod(_BinaryIntExpr):
         return truncate_int(l % r, eval_width)
 
 class BitwiseAnd(_BinaryIntExpr):
+    __slots__ = ()
+
     def get_value(self, eval_width: Optional[int]=None) -> int:
         if eval_width is None:
             eval_width = self.get_min_eval_width()
-        l = int(self.l.get_value(eval_width))
-        r = int(self.r.get_value(eval_width))
+        l = self.l.get_value(eval_width)
+        r = self.r.get_value(eval_width)
         return truncate_int(l & r, eval_width)
 
 class BitwiseOr(_BinaryIntExpr):
+    __slots__ = ()
+
     def get_value(self, eval_width: Optional[int]=None) -> int:
         if eval_width is None:
             eval_width = self.get_min_eval_width()
-        l = int(self.l.get_value(eval_width))
-        r = int(self.r.get_value(eval_width))
+        l = self.l.get_value(eval_width)
+        r = self.r.get_value(eval_width)
         return truncate_int(l | r, eval_width)
 
 class BitwiseXor(_BinaryIntExpr):
+    __slots__ = ()
+
     def get_value(self, eval_width: Optional[int]=None) -> int:
         if eval_width is None:
             eval_width = self.get_min_eval_width()
-        l = int(self.l.get_value(eval_width))
-        r = int(self.r.get_value(eval_width))
+        l = self.l.get_value(eval_width)
+        r = self.r.get_value(eval_width)
         return truncate_int(l ^ r, eval_width)
 
 class BitwiseXnor(_BinaryIntExpr):
+    __slots__ = ()
+
     def get_value(self, eval_width: Optional[int]=None) -> int:
         if eval_width is None:
             eval_width = self.get_min_eval_width()
-        l = int(self.l.get_value(eval_width))
-        r = int(self.r.get_value(eval_width))
+        l = self.l.get_value(eval_width)
+        r = self.r.get_value(eval_width)
         return truncate_int(l ^~ r, eval_width)
@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING, Optional, Type
 
 from .ast_node import ASTNode
 from .conditional import is_castable
+from .folding import fold_self_determined, fold_constant, literal_from_value
 
 if TYPE_CHECKING:
     from ..compiler import RDLEnvironment
@@ -13,6 +14,12 @@ if TYPE_CHECKING:
 #   && ||
 # Both operands are self-determined
 class _BoolExpr(ASTNode):
+    __slots__ = ("l", "r")
+
+    # Value of the left operand that determines the result without evaluating
+    # the right operand
+    _short_circuit_value = None # type: bool
+
     def __init__(self, env: 'RDLEnvironment', src_ref: 'OptionalSourceRef', l: ASTNode, r: ASTNode):
         super().__init__(env, src_ref)
         self.l = l
@@ -33,17 +40,40 @@ class _BoolExpr(ASTNode):
             )
         return bool
 
+    def is_pure(self) -> bool:
+        return self.l.is_pure() and self.r.is_pure()
+
+    def try_constant_fold(self) -> Optional[ASTNode]:
+        self.l = fold_self_determined(self.l)
+        if not self.l.is_pure():
+            # Right operand may end up not being evaluated. Folding it could
+            # report errors from an operand that is skipped.
+            return None
+
+        if bool(self.l.get_value()) == self._short_circuit_value:
+            # Left operand determines the result
+            return literal_from_value(self, self._short_circuit_value)
+
+        self.r = fold_self_determined(self.r)
+        return fold_constant(self)
+
     def get_min_eval_width(self) -> int:
         return 1
 
 class BoolAnd(_BoolExpr):
+    __slots__ = ()
+
+    _short_circuit_value = False
+
     def get_value(self, eval_width: Optional[int]=None) -> bool:
-        l = bool(self.l.get_value())
-        r = bool(self.r.get_value())
-        return l and r
+        # Right operand is only evaluated if needed
+        return bool(self.l.get_value()) and bool(self.r.get_value())
 
 class BoolOr(_BoolExpr):
+    __slots__ = ()
+
+    _short_circuit_value = True
+
     def get_value(self, eval_width: Optional[int]=None) -> bool:
-        l = bool(self.l.get_value())
-        r = bool(self.r.get_value())
-        return l or r
+        # Right operand is only evaluated if needed
+        return bool(self.l.get_value()) or bool(self.r.get_value())
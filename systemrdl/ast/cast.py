@@ -1,10 +1,9 @@
-from typing import TYPE_CHECKING, Optional, Type, Any
+from typing import TYPE_CHECKING, Optional, Type, Any, Dict, Callable
 
-from .ast_node import ASTNode
+from .ast_node import ASTNode, is_castable, clone_value
+from .folding import fold_operand, fold_self_determined, fold_constant
 
 from ..core.helpers import truncate_int
-from .. import rdltypes
-from .. import component as comp
 
 if TYPE_CHECKING:
     from ..compiler import RDLEnvironment
@@ -19,6 +18,8 @@ if TYPE_CHECKING:
 # The cast width determines the result's width
 # Also influences the min eval width of the value expression
 class WidthCast(ASTNode):
+    __slots__ = ("v", "w_expr", "cast_width")
+
     def __init__(self, env: 'RDLEnvironment', src_ref: 'OptionalSourceRef', v: ASTNode, w_expr: Optional[ASTNode]=None, w_int: int=64):
         super().__init__(env, src_ref)
 
@@ -31,6 +32,13 @@ class WidthCast(ASTNode):
             self.w_expr = None
             self.cast_width = w_int
 
+    @classmethod
+    def from_width(cls, env: 'RDLEnvironment', src_ref: 'OptionalSourceRef', v: ASTNode, w_int: int) -> 'WidthCast':
+        """
+        Create a width cast whose width is already known
+        """
+        return _StaticWidthCast(env, src_ref, v, w_int)
+
     def predict_type(self) -> Type[int]:
         if self.cast_width is None:
             if not is_castable(self.w_expr.predict_type(), int):
@@ -46,6 +54,19 @@ class WidthCast(ASTNode):
 
         return int
 
+    def is_pure(self) -> bool:
+        if (self.w_expr is not None) and not self.w_expr.is_pure():
+            return False
+        return self.v.is_pure()
+
+    def try_constant_fold(self) -> Optional[ASTNode]:
+        if self.w_expr is not None:
+            self.w_expr = fold_self_determined(self.w_expr)
+        # Value operand is evaluated in a context that is at least as wide as
+        # the cast
+        self.v = fold_operand(self.v)
+        return fold_constant(self)
+
     def get_min_eval_width(self) -> int:
         if self.cast_width is None:
             self.cast_width = int(self.w_expr.get_value())
@@ -67,10 +88,57 @@ class WidthCast(ASTNode):
 
         return truncate_int(n, self.cast_width)
 
+
+class _StaticWidthCast(WidthCast):
+    """
+    Width cast whose width is known when it is constructed
+    """
+    __slots__ = ("_mask", "_eval_width")
+
+    def __init__(self, env: 'RDLEnvironment', src_ref: 'OptionalSourceRef', v: ASTNode, w_int: int):
+        super().__init__(env, src_ref, v, w_int=w_int)
+        if w_int == 0:
+            self.msg.fatal(
+                "Cannot cast to width of zero",
+                self.src_ref
+            )
+        self._mask = (1 << w_int) - 1
+
+        # Eval width of the value operand. Resolved on first evaluation
+        self._eval_width = None # type: Optional[int]
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> '_StaticWidthCast':
+        # Members are few and known, so copy them explicitly
+        cls = self.__class__
+        result = cls.__new__(cls)
+        memo[id(self)] = result
+        result.env = self.env
+        result.msg = self.msg
+        result.src_ref = clone_value(self.src_ref, memo)
+        result.v = clone_value(self.v, memo)
+        result.w_expr = None
+        result.cast_width = self.cast_width
+        result._mask = self._mask
+
+        # Reset cached eval width when copying
+        result._eval_width = None
+        return result
+
+    def get_min_eval_width(self) -> int:
+        return self.cast_width
+
+    def get_value(self, eval_width: Optional[int]=None) -> int:
+        # Truncate to cast width instead of eval width
+        if self._eval_width is None:
+            self._eval_width = max(self.cast_width, self.v.get_min_eval_width())
+        return int(self.v.get_value(self._eval_width)) & self._mask
+
 #-------------------------------------------------------------------------------
 # Boolean cast operator
 
 class BoolCast(ASTNode):
+    __slots__ = ("n",)
+
     def __init__(self, env: 'RDLEnvironment', src_ref: 'OptionalSourceRef', n: ASTNode):
         super().__init__(env, src_ref)
         self.n = n
@@ -83,6 +151,13 @@ class BoolCast(ASTNode):
             )
         return bool
 
+    def is_pure(self) -> bool:
+        return self.n.is_pure()
+
+    def try_constant_fold(self) -> Optional[ASTNode]:
+        self.n = fold_self_determined(self.n)
+        return fold_constant(self)
+
     def get_min_eval_width(self) -> int:
         return 1
 
@@ -90,6 +165,40 @@ class BoolCast(ASTNode):
         n = int(self.n.get_value())
         return n != 0
 
+#-------------------------------------------------------------------------------
+# Integer conversion
+# Integer operators use their operands' values directly. Numeric operands that
+# are not already an int (booleans and enums) are wrapped with this node when
+# the operator's type is predicted.
+# The conversion is transparent to the width context
+class _IntCast(ASTNode):
+    __slots__ = ("n",)
+
+    def __init__(self, env: 'RDLEnvironment', src_ref: 'OptionalSourceRef', n: ASTNode):
+        super().__init__(env, src_ref)
+        self.n = n
+
+    def predict_type(self) -> Type[int]:
+        return int
+
+    def is_pure(self) -> bool:
+        return self.n.is_pure()
+
+    def try_constant_fold(self) -> Optional[ASTNode]:
+        # Booleans and enums do not depend on the width context
+        self.n = fold_operand(self.n)
+        return fold_constant(self)
+
+    def get_min_eval_width(self) -> int:
+        return self.n.get_min_eval_width()
+
+    def get_value(self, eval_width: Optional[int]=None) -> int:
+        return int(self.n.get_value(eval_width))
+
+
+def _no_conversion(v: Any) -> Any:
+    return v
+
 #-------------------------------------------------------------------------------
 # Assignment cast
 # This is a wrapper expression that normalizes the expression result
@@ -102,12 +211,23 @@ class BoolCast(ASTNode):
 # When getting value:
 #   Ensures that the expression result gets converted to the resulting type
 class AssignmentCast(ASTNode):
+    __slots__ = ("v", "dest_type", "_convert")
+
     def __init__(self, env: 'RDLEnvironment', src_ref: 'OptionalSourceRef', v: ASTNode, dest_type: 'PreElabRDLType'):
         super().__init__(env, src_ref)
 
         self.v = v
         self.dest_type = dest_type
 
+        # Conversion of the value to the destination type
+        self._convert = _no_conversion # type: Callable[[Any], Any]
+        if dest_type == bool:
+            self._convert = bool
+        elif dest_type == int:
+            self._convert = int
+
+    _copy_by_ref = ASTNode._copy_by_ref | {"_convert"}
+
     def predict_type(self) -> 'PreElabRDLType':
         op_type = self.v.predict_type()
 
@@ -119,46 +239,29 @@ class AssignmentCast(ASTNode):
 
         return self.dest_type
 
+    def is_pure(self) -> bool:
+        return self.v.is_pure()
+
+    def try_constant_fold(self) -> Optional[ASTNode]:
+        self.v = fold_self_determined(self.v)
+        return fold_constant(self)
+
     def get_min_eval_width(self) -> int:
         return self.v.get_min_eval_width()
 
     def get_value(self, eval_width: Optional[int]=None) -> Any:
-        v = self.v.get_value()
-
-        if self.dest_type == bool:
-            return bool(v)
-        elif self.dest_type == int:
-            return int(v)
-        else:
-            return v
+        return self._convert(self.v.get_value())
 
 
 #===============================================================================
 
-def is_castable(src: Any, dst: Any) -> bool:
+def int_operand(op: ASTNode, op_type: 'PreElabRDLType') -> ASTNode:
     """
-    Check if src type can be cast to dst type
+    Returns the operand to use for an integer operator, given the operand's
+    predicted type.
+    Operands that are not already an int are wrapped so that they evaluate
+    to one.
     """
-    if ((src in [int, bool]) or rdltypes.is_user_enum(src)) and (dst in [int, bool]):
-        # Pure numeric or enum can be cast to a numeric
-        return True
-    elif isinstance(src, rdltypes.ArrayedType) and isinstance(dst, rdltypes.ArrayedType):
-        # Check that array element types also match
-        if src.element_type is None:
-            # indeterminate array type. Is castable
-            return True
-        return is_castable(src.element_type, dst.element_type)
-    elif rdltypes.is_user_struct(dst):
-        # Structs can be assigned their derived counterparts - aka their subclasses
-        return issubclass(src, dst)
-    elif dst == rdltypes.PropertyReference:
-        return issubclass(src, rdltypes.PropertyReference)
-    elif dst == rdltypes.references.RefType:
-        # Any reference
-        if issubclass(src, comp.Component):
-            return True
-        return issubclass(src, rdltypes.PropertyReference)
-    elif src == dst:
-        return True
-    else:
-        return False
+    if op_type == int:
+        return op
+    return _IntCast(op.env, op.src_ref, op)
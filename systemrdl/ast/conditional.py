@@ -2,7 +2,8 @@ from typing import TYPE_CHECKING, Optional, Any
 
 from .ast_node import ASTNode
 
-from .cast import is_castable
+from .cast import is_castable, int_operand
+from .folding import fold_operand, fold_self_determined
 
 if TYPE_CHECKING:
     from ..compiler import RDLEnvironment
@@ -16,6 +17,8 @@ if TYPE_CHECKING:
 # Truth expression is self-determined and does not contribute to context
 
 class Conditional(ASTNode):
+    __slots__ = ("i", "j", "k", "is_numeric")
+
     def __init__(self, env: 'RDLEnvironment', src_ref: 'OptionalSourceRef', i: ASTNode, j: ASTNode, k: ASTNode):
         super().__init__(env, src_ref)
         self.i = i
@@ -38,6 +41,8 @@ class Conditional(ASTNode):
         typ = None # type: Any
         if is_castable(t_j, int) and is_castable(t_k, int):
             self.is_numeric = True
+            self.j = int_operand(self.j, t_j)
+            self.k = int_operand(self.k, t_k)
             typ = int
         elif t_j == t_k:
             # Same types. Inherently compatible
@@ -51,6 +56,34 @@ class Conditional(ASTNode):
             )
         return typ
 
+    def is_pure(self) -> bool:
+        return self.i.is_pure() and self.j.is_pure() and self.k.is_pure()
+
+    def try_constant_fold(self) -> Optional[ASTNode]:
+        self.i = fold_self_determined(self.i)
+
+        if not self.i.is_pure():
+            # Either operand may end up not being evaluated. Folding it could
+            # report errors from an operand that is never selected.
+            return None
+
+        if self.i.get_value():
+            self.j = fold_operand(self.j)
+            selected = self.j
+        else:
+            self.k = fold_operand(self.k)
+            selected = self.k
+
+        if not self.is_numeric:
+            return selected
+
+        # Numeric results are evaluated in the context of both j and k.
+        # The selected operand can only replace this node if doing so does not
+        # change the width context
+        if selected.get_min_eval_width() == self.get_min_eval_width():
+            return selected
+        return None
+
     def get_min_eval_width(self) -> int:
         # Truth operand has no influence in evaluation context
         return(max(
@@ -60,23 +93,17 @@ class Conditional(ASTNode):
 
     def get_value(self, eval_width: Optional[int]=None) -> Any:
         # i is self-determined
-        i = bool(self.i.get_value())
+        # Only the selected operand is evaluated
+        if self.i.get_value():
+            selected = self.j
+        else:
+            selected = self.k
 
         if self.is_numeric:
             if eval_width is None:
-                eval_width = max(
-                    self.j.get_min_eval_width(),
-                    self.k.get_min_eval_width()
-                )
-            j = self.j.get_value(eval_width)
-            k = self.k.get_value(eval_width)
+                eval_width = self.get_min_eval_width()
+            return selected.get_value(eval_width)
         elif not self.is_numeric:
-            j = self.j.get_value()
-            k = self.k.get_value()
+            return selected.get_value()
         else:
             raise RuntimeError
-
-        if i:
-            return j
-        else:
-            return k
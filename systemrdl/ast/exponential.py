@@ -1,7 +1,8 @@
 from typing import TYPE_CHECKING, Optional, Type
 
 from .ast_node import ASTNode
-from .conditional import is_castable
+from .cast import is_castable, int_operand
+from .folding import fold_operand, fold_self_determined
 
 from ..core.helpers import truncate_int
 
@@ -15,6 +16,8 @@ if TYPE_CHECKING:
 #   **  <<  >>
 # Righthand operand is self-determined
 class _ExpShiftExpr(ASTNode):
+    __slots__ = ("l", "r")
+
     def __init__(self, env: 'RDLEnvironment', src_ref: 'OptionalSourceRef', l: ASTNode, r: ASTNode):
         super().__init__(env, src_ref)
         self.l = l
@@ -33,35 +36,52 @@ class _ExpShiftExpr(ASTNode):
                 "Right operand of expression is not a compatible numeric type",
                 self.src_ref
             )
+        self.l = int_operand(self.l, l_type)
+        self.r = int_operand(self.r, r_type)
         return int
 
+    def is_pure(self) -> bool:
+        return self.l.is_pure() and self.r.is_pure()
+
+    def try_constant_fold(self) -> Optional[ASTNode]:
+        # Value depends on the width context, so only operands can be folded
+        self.l = fold_operand(self.l)
+        self.r = fold_self_determined(self.r)
+        return super().try_constant_fold()
+
     def get_min_eval_width(self) -> int:
         # Righthand op has no influence in evaluation context
         return self.l.get_min_eval_width()
 
 class Exponent(_ExpShiftExpr):
+    __slots__ = ()
+
     def get_value(self, eval_width: Optional[int]=None) -> int:
         if eval_width is None:
             eval_width = self.l.get_min_eval_width()
         # Right operand is self-determined
-        l = int(self.l.get_value(eval_width))
-        r = int(self.r.get_value())
+        l = self.l.get_value(eval_width)
+        r = self.r.get_value()
         return truncate_int(int(l ** r), eval_width)
 
 class LShift(_ExpShiftExpr):
+    __slots__ = ()
+
     def get_value(self, eval_width: Optional[int]=None) -> int:
         if eval_width is None:
             eval_width = self.l.get_min_eval_width()
         # Right operand is self-determined
-        l = int(self.l.get_value(eval_width))
-        r = int(self.r.get_value())
+        l = self.l.get_value(eval_width)
+        r = self.r.get_value()
         return truncate_int(l << r, eval_width)
 
 class RShift(_ExpShiftExpr):
+    __slots__ = ()
+
     def get_value(self, eval_width: Optional[int]=None) -> int:
         if eval_width is None:
             eval_width = self.l.get_min_eval_width()
         # Right operand is self-determined
-        l = int(self.l.get_value(eval_width))
-        r = int(self.r.get_value())
+        l = self.l.get_value(eval_width)
+        r = self.r.get_value()
         return truncate_int(l >> r, eval_width)
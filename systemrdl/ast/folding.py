@@ -0,0 +1,91 @@
+from typing import Optional, Any
+
+from .ast_node import ASTNode
+from .literals import BoolLiteral, IntLiteral, StringLiteral
+from .literals import BuiltinEnumLiteral, EnumLiteral
+
+from .. import rdltypes
+
+#-------------------------------------------------------------------------------
+# Constant folding
+#
+# Expressions are folded once where they are defined, right after their type
+# was predicted. Instances of a component are copies of its definition, so
+# they all share the folded tree instead of re-evaluating constant subtrees.
+#
+# Care is needed for integer expressions that propagate their parent's width
+# context (binary, unary, shift and numeric conditional operators).
+# Their value depends on the width they are evaluated in, so they can only be
+# replaced by a literal where they start a new self-determined context.
+#-------------------------------------------------------------------------------
+
+LITERAL_TYPES = (
+    BoolLiteral, IntLiteral, StringLiteral, BuiltinEnumLiteral, EnumLiteral
+)
+
+
+def fold_constants(expr: ASTNode) -> ASTNode:
+    """
+    Fold constant subexpressions of an expression whose type was already
+    predicted.
+    The expression is evaluated in its own self-determined context.
+
+    Returns the expression to use in place of expr.
+    """
+    return fold_self_determined(expr)
+
+
+def literal_from_value(node: ASTNode, value: Any) -> Optional[ASTNode]:
+    """
+    Create a literal that is equivalent to the node's value.
+    Returns None if the value cannot be represented as a literal.
+    """
+    if isinstance(value, (bool, rdltypes.UserEnum)) and node.predict_type() == int:
+        # Numeric node whose value was not converted to an int. The literal
+        # shall keep the node's integer width
+        return IntLiteral.get(node.env, node.src_ref, int(value), node.get_min_eval_width())
+    if isinstance(value, bool):
+        return BoolLiteral(node.env, node.src_ref, value)
+    if isinstance(value, int):
+        return IntLiteral.get(node.env, node.src_ref, value, node.get_min_eval_width())
+    if isinstance(value, str):
+        return StringLiteral(node.env, node.src_ref, value)
+    if isinstance(value, rdltypes.BuiltinEnum):
+        return BuiltinEnumLiteral(node.env, node.src_ref, value)
+    if isinstance(value, rdltypes.UserEnum):
+        return EnumLiteral(node.env, node.src_ref, value)
+    return None
+
+
+def fold_operand(op: ASTNode) -> ASTNode:
+    """
+    Fold an operand that is evaluated in its parent's width context
+    """
+    folded = op.try_constant_fold()
+    if folded is None:
+        return op
+    return folded
+
+
+def fold_self_determined(op: ASTNode) -> ASTNode:
+    """
+    Fold an operand that is evaluated in its own self-determined context.
+    Since the width context is known, the operand can be replaced by a literal
+    if it is pure, regardless of its operator.
+    """
+    folded = fold_operand(op)
+    if folded is op and op.is_pure() and not isinstance(op, LITERAL_TYPES):
+        literal = literal_from_value(op, op.get_value())
+        if literal is not None:
+            return literal
+    return folded
+
+
+def fold_constant(node: ASTNode) -> Optional[ASTNode]:
+    """
+    Returns a literal that can replace the node if it is pure.
+    Only valid for nodes whose value does not depend on the width context.
+    """
+    if node.is_pure():
+        return literal_from_value(node, node.get_value())
+    return None
@@ -1,8 +1,7 @@
 from collections import OrderedDict
 from typing import TYPE_CHECKING, Optional, Type, Dict, Tuple, List, Any
 
-from .ast_node import ASTNode
-from .conditional import is_castable
+from .ast_node import ASTNode, is_castable
 
 from .. import rdltypes
 from .. import component as comp
@@ -14,11 +13,28 @@ if TYPE_CHECKING:
 
     OptionalSourceRef = Optional[SourceRefBase]
 
-class BoolLiteral(ASTNode):
+class _ImmutableLiteral(ASTNode):
+    """
+    Base class for literals of immutable values.
+    These are never modified once created, so they are shared rather than
+    copied when deepcopying an expression tree.
+    """
+    __slots__ = ()
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> '_ImmutableLiteral':
+        return self
+
+
+class BoolLiteral(_ImmutableLiteral):
+    __slots__ = ("val",)
+
     def __init__(self, env: 'RDLEnvironment', src_ref: 'OptionalSourceRef', val: bool):
         super().__init__(env, src_ref)
         self.val = val
 
+    def is_pure(self) -> bool:
+        return True
+
     def predict_type(self) -> Type[bool]:
         return bool
 
@@ -29,12 +45,39 @@ class BoolLiteral(ASTNode):
         return self.val
 
 
-class IntLiteral(ASTNode):
+class IntLiteral(_ImmutableLiteral):
+    __slots__ = ("val", "width")
+
+    # Values and widths up to this size are interned by IntLiteral.get()
+    _intern_max = 64
+
     def __init__(self, env: 'RDLEnvironment', src_ref: 'OptionalSourceRef', val: int, width: int=64):
         super().__init__(env, src_ref)
         self.val = val
         self.width = width
 
+    @classmethod
+    def get(cls, env: 'RDLEnvironment', src_ref: 'OptionalSourceRef', val: int, width: int=64) -> 'IntLiteral':
+        """
+        Get a shared IntLiteral for the given value.
+
+        Used for literals that do not originate from the source text, such as
+        the results of constant folding. Small values are shared per
+        environment instead of being allocated for every occurrence.
+        Shared literals do not have a src_ref.
+        """
+        if 0 <= val <= cls._intern_max and width <= cls._intern_max:
+            key = (val, width)
+            literal = env.int_literal_cache.get(key)
+            if literal is None:
+                literal = cls(env, None, val, width)
+                env.int_literal_cache[key] = literal
+            return literal
+        return cls(env, src_ref, val, width)
+
+    def is_pure(self) -> bool:
+        return True
+
     def predict_type(self) -> Type[int]:
         return int
 
@@ -45,15 +88,20 @@ class IntLiteral(ASTNode):
         return self.val
 
 
-class BuiltinEnumLiteral(ASTNode):
+class BuiltinEnumLiteral(_ImmutableLiteral):
     """
     ASTNode wrapper for builtin RDL enumeration types:
     AccessType, OnReadType, OnWriteType, AddressingType, PrecedenceType
     """
+    __slots__ = ("val",)
+
     def __init__(self, env: 'RDLEnvironment', src_ref: 'OptionalSourceRef', val: rdltypes.BuiltinEnum):
         super().__init__(env, src_ref)
         self.val = val
 
+    def is_pure(self) -> bool:
+        return True
+
     def predict_type(self) -> Type[rdltypes.BuiltinEnum]:
         return type(self.val)
 
@@ -61,11 +109,16 @@ class BuiltinEnumLiteral(ASTNode):
         return self.val
 
 
-class EnumLiteral(ASTNode):
+class EnumLiteral(_ImmutableLiteral):
+    __slots__ = ("val",)
+
     def __init__(self, env: 'RDLEnvironment', src_ref: 'OptionalSourceRef', val: rdltypes.UserEnum):
         super().__init__(env, src_ref)
         self.val = val
 
+    def is_pure(self) -> bool:
+        return True
+
     def predict_type(self) -> Type[rdltypes.UserEnum]:
         return type(self.val)
 
@@ -77,6 +130,8 @@ class EnumLiteral(ASTNode):
 
 
 class StructLiteral(ASTNode):
+    __slots__ = ("struct_type", "values")
+
     def __init__(self, env: 'RDLEnvironment', src_ref: 'OptionalSourceRef', struct_type: Type[rdltypes.UserStruct], values: Dict[str, Tuple[ASTNode, 'OptionalSourceRef']]):
         super().__init__(env, src_ref)
         self.struct_type = struct_type
@@ -103,11 +158,16 @@ class StructLiteral(ASTNode):
         return self.struct_type(resolved_values)
 
 
-class StringLiteral(ASTNode):
+class StringLiteral(_ImmutableLiteral):
+    __slots__ = ("val",)
+
     def __init__(self, env: 'RDLEnvironment', src_ref: 'OptionalSourceRef', val: str):
         super().__init__(env, src_ref)
         self.val = val
 
+    def is_pure(self) -> bool:
+        return True
+
     def predict_type(self) -> Type[str]:
         return str
 
@@ -116,6 +176,8 @@ class StringLiteral(ASTNode):
 
 
 class ArrayLiteral(ASTNode):
+    __slots__ = ("elements",)
+
     def __init__(self, env: 'RDLEnvironment', src_ref: 'OptionalSourceRef', elements: List[ASTNode]):
         super().__init__(env, src_ref)
         self.elements = elements
@@ -190,6 +252,8 @@ class ExternalLiteral(ASTNode):
     ASTNode wrapper for literal value that was not compiled from a source file.
     The value provided is not an expression, but the actual value.
     """
+    __slots__ = ("value",)
+
     def __init__(self, env: 'RDLEnvironment', value: 'RDLValue'):
         super().__init__(env, None)
         self.value = value
@@ -1,9 +1,10 @@
-from typing import TYPE_CHECKING, Optional, Type
+from typing import TYPE_CHECKING, Optional, Type, Tuple
 
 from .ast_node import ASTNode
-from .conditional import is_castable
+from .cast import is_castable, int_operand
+from .folding import fold_self_determined, fold_constant
 
-from ..core.helpers import truncate_int
+from ..core.helpers import get_trunc_mask, parity
 
 if TYPE_CHECKING:
     from ..compiler import RDLEnvironment
@@ -16,6 +17,8 @@ if TYPE_CHECKING:
 # Result is always 1 bit int
 # Creates a new evaluation context
 class _ReductionExpr(ASTNode):
+    __slots__ = ("n",)
+
     def __init__(self, env: 'RDLEnvironment', src_ref: 'OptionalSourceRef', n: ASTNode):
         super().__init__(env, src_ref)
         self.n = n
@@ -27,60 +30,82 @@ class _ReductionExpr(ASTNode):
                 "Operand of expression is not a compatible numeric type",
                 self.src_ref
             )
+        self.n = int_operand(self.n, op_type)
         return int
 
+    def is_pure(self) -> bool:
+        return self.n.is_pure()
+
+    def try_constant_fold(self) -> Optional[ASTNode]:
+        self.n = fold_self_determined(self.n)
+        return fold_constant(self)
+
     def get_min_eval_width(self) -> int:
         return 1
 
-class AndReduce(_ReductionExpr):
-    def get_value(self, eval_width: Optional[int]=None) -> int:
+# Reductions whose result depends on the width of the operand
+class _MaskedReductionExpr(_ReductionExpr):
+    __slots__ = ()
+
+    def get_ops(self) -> Tuple[int, int]:
+        """
+        Evaluates the operand in its own self-determined context.
+        Returns the operand value truncated to its width, and the width's mask
+        """
         eval_width = self.n.get_min_eval_width()
-        n = int(self.n.get_value(eval_width))
-        n = truncate_int(~n, eval_width)
-        return int(n == 0)
+        mask = get_trunc_mask(eval_width)
+        n = self.n.get_value(eval_width) & mask
+        return n, mask
+
+class AndReduce(_MaskedReductionExpr):
+    __slots__ = ()
 
-class NandReduce(_ReductionExpr):
     def get_value(self, eval_width: Optional[int]=None) -> int:
-        eval_width = self.n.get_min_eval_width()
-        n = int(self.n.get_value(eval_width))
-        n = truncate_int(~n, eval_width)
-        return int(n != 0)
+        n, mask = self.get_ops()
+        return int(n == mask)
+
+class NandReduce(_MaskedReductionExpr):
+    __slots__ = ()
+
+    def get_value(self, eval_width: Optional[int]=None) -> int:
+        n, mask = self.get_ops()
+        return int(n != mask)
 
 class OrReduce(_ReductionExpr):
+    __slots__ = ()
+
     def get_value(self, eval_width: Optional[int]=None) -> int:
-        n = int(self.n.get_value())
+        n = self.n.get_value()
         return int(n != 0)
 
 class NorReduce(_ReductionExpr):
+    __slots__ = ()
+
     def get_value(self, eval_width: Optional[int]=None) -> int:
-        n = int(self.n.get_value())
+        n = self.n.get_value()
         return int(n == 0)
 
-class XorReduce(_ReductionExpr):
+class XorReduce(_MaskedReductionExpr):
+    __slots__ = ()
+
     def get_value(self, eval_width: Optional[int]=None) -> int:
-        n = int(self.n.get_value())
-        v = 0
-        while n:
-            if n & 1:
-                v ^= 1
-            n >>= 1
-        return v
-
-class XnorReduce(_ReductionExpr):
+        n, _ = self.get_ops()
+        return parity(n)
+
+class XnorReduce(_MaskedReductionExpr):
+    __slots__ = ()
+
     def get_value(self, eval_width: Optional[int]=None) -> int:
-        n = int(self.n.get_value())
-        v = 1
-        while n:
-            if n & 1:
-                v ^= 1
-            n >>= 1
-        return v
+        n, _ = self.get_ops()
+        return 1 ^ parity(n)
 
 class BoolNot(_ReductionExpr):
+    __slots__ = ()
+
     def predict_type(self) -> Type[bool]:
         super().predict_type()
         return bool
 
     def get_value(self, eval_width: Optional[int]=None) -> bool:
-        n = int(self.n.get_value())
+        n = self.n.get_value()
         return not n
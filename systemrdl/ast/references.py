@@ -1,10 +1,9 @@
 from typing import TYPE_CHECKING, Optional, Any, List, Tuple, Dict, Type
-from copy import deepcopy
 
 from .. import rdltypes
 from .. import component as comp
 
-from .ast_node import ASTNode
+from .ast_node import ASTNode, get_copy_members, clone_value
 from .conditional import is_castable
 
 if TYPE_CHECKING:
@@ -16,6 +15,8 @@ if TYPE_CHECKING:
     OptionalSourceRef = Optional[SourceRefBase]
 
 class ParameterRef(ASTNode):
+    __slots__ = ("param",)
+
     def __init__(self, env: 'RDLEnvironment', src_ref: 'OptionalSourceRef', param: 'Parameter'):
         super().__init__(env, src_ref)
         self.param = param
@@ -41,6 +42,8 @@ class ParameterRef(ASTNode):
 
 
 class ArrayIndex(ASTNode):
+    __slots__ = ("array", "index")
+
     def __init__(self, env: 'RDLEnvironment', src_ref: 'OptionalSourceRef', array: ASTNode, index: ASTNode):
         super().__init__(env, src_ref)
         self.array = array
@@ -79,6 +82,8 @@ class ArrayIndex(ASTNode):
 
 
 class MemberRef(ASTNode):
+    __slots__ = ("struct", "member_name")
+
     def __init__(self, env: 'RDLEnvironment', src_ref: 'OptionalSourceRef', struct: ASTNode, member_name: str):
         super().__init__(env, src_ref)
         self.struct = struct
@@ -115,6 +120,8 @@ RefElementsType = List[
     Tuple[str, List[ASTNode], 'OptionalSourceRef']
 ]
 class InstRef(ASTNode):
+    __slots__ = ("ref_root", "ref_elements", "_predicted_type", "_cref")
+
     def __init__(self, env: 'RDLEnvironment', ref_root: comp.Component, ref_elements: RefElementsType):
         super().__init__(env, None) # single src_ref doesn't make sense for InstRef
 
@@ -134,26 +141,35 @@ class InstRef(ASTNode):
         # ]
         self.ref_elements = ref_elements
 
+        # Component type resolved by predict_type()
+        self._predicted_type = None # type: Optional[Type[comp.Component]]
+
+        # If all array suffixes are constant, the resulting reference never
+        # changes and is only built once
+        self._cref = None # type: Optional[rdltypes.ComponentRef]
+
+    _copy_by_ref = ASTNode._copy_by_ref | {"ref_root", "_cref"}
+
     def __deepcopy__(self, memo: Dict[int, Any]) -> 'InstRef':
         """
         Copy any Source Ref by ref within the ref_elements list when deepcopying
         """
-        copy_by_ref = ["env", "msg", "ref_root"]
         cls = self.__class__
         result = cls.__new__(cls)
         memo[id(self)] = result
-        for k, v in self.__dict__.items():
-            if k in copy_by_ref:
-                setattr(result, k, v)
-            elif k == "ref_elements":
-                # Manually deepcopy the ref_elements list
-                new_ref_elements = []
-                for src_name, src_array_suffixes, src_src_ref in v:
-                    new_array_suffixes = deepcopy(src_array_suffixes, memo)
-                    new_ref_elements.append((src_name, new_array_suffixes, src_src_ref))
-                setattr(result, k, new_ref_elements)
-            else:
-                setattr(result, k, deepcopy(v, memo))
+        by_ref, cloned = get_copy_members(cls)
+        for k in by_ref:
+            setattr(result, k, getattr(self, k))
+        for k in cloned:
+            if k != "ref_elements":
+                setattr(result, k, clone_value(getattr(self, k), memo))
+
+        # Manually deepcopy the ref_elements list
+        new_ref_elements = []
+        for src_name, src_array_suffixes, src_src_ref in self.ref_elements:
+            new_array_suffixes = [clone_value(suffix, memo) for suffix in src_array_suffixes]
+            new_ref_elements.append((src_name, new_array_suffixes, src_src_ref))
+        result.ref_elements = new_ref_elements
         return result
 
     def predict_type(self) -> Type[comp.Component]:
@@ -162,6 +178,10 @@ class InstRef(ASTNode):
         referenced.
         Also do some checks on the array indexes
         """
+        if self._predicted_type is not None:
+            # Path was already resolved and checked
+            return self._predicted_type
+
         current_comp = self.ref_root
         for name, array_suffixes, name_src_ref in self.ref_elements:
 
@@ -195,26 +215,41 @@ class InstRef(ASTNode):
                     name_src_ref
                 )
 
-        return type(current_comp)
+        self._predicted_type = type(current_comp)
+        return self._predicted_type
 
     def get_value(self, eval_width: Optional[int]=None) -> rdltypes.ComponentRef:
         """
         Build a resolved ComponentRef container that describes the relative path
         """
+        if self._cref is not None:
+            return self._cref
 
-        resolved_ref_elements = []
+        resolved_ref_elements = [] # type: List[rdltypes.references.RefElement]
+        append = resolved_ref_elements.append
+        is_constant = True
 
+        # Evaluate indexes and check whether they are constant in one pass
         for name, array_suffixes, name_src_ref in self.ref_elements:
-            idx_list = [suffix.get_value() for suffix in array_suffixes]
-            resolved_ref_elements.append((name, idx_list, name_src_ref))
+            idx_list = [] # type: List[int]
+            for suffix in array_suffixes:
+                idx_list.append(suffix.get_value())
+                if is_constant and not suffix.is_pure():
+                    is_constant = False
+            append((name, idx_list, name_src_ref))
 
         # Create container
         cref = rdltypes.ComponentRef(self.ref_root, resolved_ref_elements)
 
+        if is_constant:
+            self._cref = cref
+
         return cref
 
 
 class PropRef(ASTNode):
+    __slots__ = ("inst_ref", "prop_ref_type")
+
     def __init__(self, env: 'RDLEnvironment', src_ref: 'OptionalSourceRef', inst_ref: ASTNode, prop_ref_type: Type[rdltypes.PropertyReference]):
         super().__init__(env, src_ref)
         # InstRef to the component whose property is being referenced
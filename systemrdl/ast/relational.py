@@ -1,7 +1,8 @@
 from typing import TYPE_CHECKING, Type, Optional, Any, Tuple
 
 from .ast_node import ASTNode
-from .conditional import is_castable
+from .cast import is_castable, int_operand
+from .folding import fold_operand, fold_constant
 
 if TYPE_CHECKING:
     from ..compiler import RDLEnvironment
@@ -17,6 +18,8 @@ if TYPE_CHECKING:
 # Child operands are evaluated in the same width context, sized to the max
 # of either op.
 class _RelationalExpr(ASTNode):
+    __slots__ = ("l", "r", "is_numeric")
+
     def __init__(self, env: 'RDLEnvironment', src_ref: 'OptionalSourceRef', l: ASTNode, r: ASTNode):
         super().__init__(env, src_ref)
         self.l = l
@@ -30,6 +33,8 @@ class _RelationalExpr(ASTNode):
         # Type of L and R operands shall be compatible
         if is_castable(l_type, int) and is_castable(r_type, int):
             self.is_numeric = True
+            self.l = int_operand(self.l, l_type)
+            self.r = int_operand(self.r, r_type)
         elif l_type == r_type:
             # Same types. Inherently compatible
             self.is_numeric = False
@@ -41,6 +46,15 @@ class _RelationalExpr(ASTNode):
             )
         return bool
 
+    def is_pure(self) -> bool:
+        return self.l.is_pure() and self.r.is_pure()
+
+    def try_constant_fold(self) -> Optional[ASTNode]:
+        # Both operands share the same width context
+        self.l = fold_operand(self.l)
+        self.r = fold_operand(self.r)
+        return fold_constant(self)
+
     def get_min_eval_width(self) -> int:
         return 1
 
@@ -53,8 +67,8 @@ class _RelationalExpr(ASTNode):
                 self.r.get_min_eval_width()
             )
 
-            l = int(self.l.get_value(eval_width))
-            r = int(self.r.get_value(eval_width))
+            l = self.l.get_value(eval_width)
+            r = self.r.get_value(eval_width)
         elif not self.is_numeric:
             l = self.l.get_value()
             r = self.r.get_value()
@@ -64,6 +78,7 @@ class _RelationalExpr(ASTNode):
         return l, r
 
 class _NumericRelationalExpr(_RelationalExpr):
+    __slots__ = ()
 
     def predict_type(self) -> Type[bool]:
         l_type = self.l.predict_type()
@@ -81,36 +96,50 @@ class _NumericRelationalExpr(_RelationalExpr):
                 "Right operand of expression is not a compatible numeric type",
                 self.src_ref
             )
+        self.l = int_operand(self.l, l_type)
+        self.r = int_operand(self.r, r_type)
         return bool
 
 
 
 class Eq(_RelationalExpr):
+    __slots__ = ()
+
     def get_value(self, eval_width: Optional[int]=None) -> bool:
         l, r = self.get_ops()
         return l == r
 
 class Neq(_RelationalExpr):
+    __slots__ = ()
+
     def get_value(self, eval_width: Optional[int]=None) -> bool:
         l, r = self.get_ops()
         return l != r
 
 class Lt(_NumericRelationalExpr):
+    __slots__ = ()
+
     def get_value(self, eval_width: Optional[int]=None) -> bool:
         l, r = self.get_ops()
         return l < r
 
 class Gt(_NumericRelationalExpr):
+    __slots__ = ()
+
     def get_value(self, eval_width: Optional[int]=None) -> bool:
         l, r = self.get_ops()
         return l > r
 
 class Leq(_NumericRelationalExpr):
+    __slots__ = ()
+
     def get_value(self, eval_width: Optional[int]=None) -> bool:
         l, r = self.get_ops()
         return l <= r
 
 class Geq(_NumericRelationalExpr):
+    __slots__ = ()
+
     def get_value(self, eval_width: Optional[int]=None) -> bool:
         l, r = self.get_ops()
         return l >= r
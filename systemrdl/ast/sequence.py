@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING, Optional, Type, List, Union
 
 from .ast_node import ASTNode
 from .conditional import is_castable
+from .folding import fold_self_determined, fold_constant
 
 if TYPE_CHECKING:
     from ..compiler import RDLEnvironment
@@ -10,6 +11,8 @@ if TYPE_CHECKING:
     OptionalSourceRef = Optional[SourceRefBase]
 
 class Concatenate(ASTNode):
+    __slots__ = ("elements", "type")
+
     def __init__(self, env: 'RDLEnvironment', src_ref: 'OptionalSourceRef', elements: List[ASTNode]):
         super().__init__(env, src_ref)
         self.elements = elements
@@ -40,6 +43,13 @@ class Concatenate(ASTNode):
             )
         return self.type
 
+    def is_pure(self) -> bool:
+        return all(element.is_pure() for element in self.elements)
+
+    def try_constant_fold(self) -> Optional[ASTNode]:
+        self.elements = [fold_self_determined(element) for element in self.elements]
+        return fold_constant(self)
+
     def get_min_eval_width(self) -> int:
         if self.type == int:
             width = 0
@@ -70,6 +80,8 @@ class Concatenate(ASTNode):
 
 
 class Replicate(ASTNode):
+    __slots__ = ("reps", "concat", "type", "reps_value")
+
     def __init__(self, env: 'RDLEnvironment', src_ref: 'OptionalSourceRef', reps: ASTNode, concat: ASTNode):
         super().__init__(env, src_ref)
         self.reps = reps
@@ -99,6 +111,14 @@ class Replicate(ASTNode):
             # Type check for invalid type is already handled there
             raise RuntimeError
 
+    def is_pure(self) -> bool:
+        return self.reps.is_pure() and self.concat.is_pure()
+
+    def try_constant_fold(self) -> Optional[ASTNode]:
+        self.reps = fold_self_determined(self.reps)
+        self.concat = fold_self_determined(self.concat)
+        return fold_constant(self)
+
     def get_min_eval_width(self) -> int:
         # Evaluate number of repetitions
         if self.reps_value is None:
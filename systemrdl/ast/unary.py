@@ -1,7 +1,8 @@
 from typing import TYPE_CHECKING, Optional, Type
 
 from .ast_node import ASTNode
-from .conditional import is_castable
+from .cast import is_castable, int_operand
+from .folding import fold_operand
 
 from ..core.helpers import truncate_int
 
@@ -15,6 +16,8 @@ if TYPE_CHECKING:
 #   +  -  ~
 # Normal expression context rules
 class _UnaryIntExpr(ASTNode):
+    __slots__ = ("n",)
+
     def __init__(self, env: 'RDLEnvironment', src_ref: 'OptionalSourceRef', n: ASTNode):
         super().__init__(env, src_ref)
         self.n = n
@@ -26,28 +29,43 @@ class _UnaryIntExpr(ASTNode):
                 "Operand of expression is not a compatible numeric type",
                 self.src_ref
             )
+        self.n = int_operand(self.n, op_type)
         return int
 
+    def is_pure(self) -> bool:
+        return self.n.is_pure()
+
+    def try_constant_fold(self) -> Optional[ASTNode]:
+        # Value depends on the width context, so only the operand can be folded
+        self.n = fold_operand(self.n)
+        return super().try_constant_fold()
+
     def get_min_eval_width(self) -> int:
         return self.n.get_min_eval_width()
 
 class UnaryPlus(_UnaryIntExpr):
+    __slots__ = ()
+
     def get_value(self, eval_width: Optional[int]=None) -> int:
         if eval_width is None:
             eval_width = self.get_min_eval_width()
-        n = int(self.n.get_value(eval_width))
+        n = self.n.get_value(eval_width)
         return truncate_int(n, eval_width)
 
 class UnaryMinus(_UnaryIntExpr):
+    __slots__ = ()
+
     def get_value(self, eval_width: Optional[int]=None) -> int:
         if eval_width is None:
             eval_width = self.get_min_eval_width()
-        n = int(self.n.get_value(eval_width))
+        n = self.n.get_value(eval_width)
         return truncate_int(-n, eval_width)
 
 class BitwiseInvert(_UnaryIntExpr):
+    __slots__ = ()
+
     def get_value(self, eval_width: Optional[int]=None) -> int:
         if eval_width is None:
             eval_width = self.get_min_eval_width()
-        n = int(self.n.get_value(eval_width))
+        n = self.n.get_value(eval_width)
         return truncate_int(~n, eval_width)
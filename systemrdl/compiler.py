@@ -1,4 +1,4 @@
-from typing import Set, Type, Any, List, Dict, Optional, Iterable, TYPE_CHECKING
+from typing import Set, Type, Any, List, Dict, Tuple, Optional, Iterable, TYPE_CHECKING
 import warnings as py_warnings
 
 from antlr4 import InputStream
@@ -500,6 +500,10 @@ class RDLEnvironment:
         self.msg = messages.MessageHandler(message_printer)
         self.property_rules = PropertyRuleBook(self)
 
+        # Shared IntLiteral objects for small constants
+        # See ast.IntLiteral.get()
+        self.int_literal_cache = {} # type: Dict[Tuple[int, int], ast.IntLiteral]
+
     @staticmethod
     def chk_flag_severity(flag: int, w_flags: int, e_flags: int) -> messages.Severity:
         if bool(e_flags & flag):
@@ -288,7 +288,7 @@ class ComponentVisitor(BaseVisitor):
                 param.param_type
             )
             assign_expr.predict_type()
-            param.expr = assign_expr
+            param.expr = ast.fold_constants(assign_expr)
 
 
     def resolve_inst_external(self, ctx: SystemRDLParser.Component_instsContext, comp_inst: comp.Component, inst_type: 'CommonToken') -> None:
@@ -349,7 +349,7 @@ class ComponentVisitor(BaseVisitor):
         expr = visitor.visit(ctx.expr())
         expr = ast.AssignmentCast(self.compiler.env, src_ref_from_antlr(ctx.op), expr, int)
         expr.predict_type()
-        return expr
+        return ast.fold_constants(expr)
 
     def visitComponent_inst(self, ctx: SystemRDLParser.Component_instContext) -> None:
         # Unpack instance def info from parent
@@ -531,6 +531,7 @@ class ComponentVisitor(BaseVisitor):
                 param_type
             )
             default_expr.predict_type()
+            default_expr = ast.fold_constants(default_expr)
         else:
             default_expr = None
 
@@ -840,10 +841,12 @@ class ComponentVisitor(BaseVisitor):
         expr1 = visitor.visit(ctx.expr(0))
         expr1 = ast.AssignmentCast(self.compiler.env, src_ref_from_antlr(ctx.expr(0)), expr1, int)
         expr1.predict_type()
+        expr1 = ast.fold_constants(expr1)
 
         expr2 = visitor.visit(ctx.expr(1))
         expr2 = ast.AssignmentCast(self.compiler.env, src_ref_from_antlr(ctx.expr(1)), expr2, int)
         expr2.predict_type()
+        expr2 = ast.fold_constants(expr2)
 
         return expr1, expr2
 
@@ -852,7 +855,7 @@ class ComponentVisitor(BaseVisitor):
         expr = visitor.visit(ctx.expr())
         expr = ast.AssignmentCast(self.compiler.env, src_ref_from_antlr(ctx.expr()), expr, int)
         expr.predict_type()
-        return expr
+        return ast.fold_constants(expr)
 
     #---------------------------------------------------------------------------
     # Type Handling
@@ -85,6 +85,7 @@ class UDPVisitor(BaseVisitor):
                             self.compiler.env, src_ref_from_antlr(expr_ctx),
                             expr, valid_type
                         )
+                        expr = ast.fold_constants(expr)
                     break
             else:
                 self.msg.fatal(
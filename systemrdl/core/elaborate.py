@@ -1,5 +1,5 @@
 import hashlib
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, List, Optional, Any
 
 from ..ast import ASTNode
 from .helpers import is_pow2, roundup_pow2, roundup_to
@@ -45,11 +45,15 @@ class ElabExpressionsListener(walker.RDLListener):
     def enter_AddressableComponent(self, node: AddressableNode) -> None:
         assert isinstance(node.inst, comp.AddressableComponent)
         # Evaluate instance object expressions
-        if isinstance(node.inst.addr_offset, ASTNode):
-            node.inst.addr_offset = node.inst.addr_offset.get_value()
-
-        if isinstance(node.inst.addr_align, ASTNode):
-            node.inst.addr_align = node.inst.addr_align.get_value()
+        # Attributes are typed by their elaborated value, but still hold an
+        # expression at this point
+        addr_offset = node.inst.addr_offset # type: Any
+        if isinstance(addr_offset, ASTNode):
+            node.inst.addr_offset = addr_offset.get_value()
+
+        addr_align = node.inst.addr_align # type: Any
+        if isinstance(addr_align, ASTNode):
+            node.inst.addr_align = addr_align.get_value()
             if node.inst.addr_align == 0:
                 self.msg.fatal(
                     "Alignment allocator '%=' must be greater than zero",
@@ -57,6 +61,7 @@ class ElabExpressionsListener(walker.RDLListener):
                 )
 
         if node.inst.array_dimensions:
+            dim = None # type: Any
             for i, dim in enumerate(node.inst.array_dimensions):
                 if isinstance(dim, ASTNode):
                     node.inst.array_dimensions[i] = dim.get_value()
@@ -66,8 +71,9 @@ class ElabExpressionsListener(walker.RDLListener):
                             node.inst.inst_src_ref
                         )
 
-        if isinstance(node.inst.array_stride, ASTNode):
-            node.inst.array_stride = node.inst.array_stride.get_value()
+        array_stride = node.inst.array_stride # type: Any
+        if isinstance(array_stride, ASTNode):
+            node.inst.array_stride = array_stride.get_value()
             if node.inst.array_stride == 0:
                 self.msg.fatal(
                     "Array stride allocator '+=' must be greater than zero",
@@ -78,19 +84,24 @@ class ElabExpressionsListener(walker.RDLListener):
     def enter_VectorComponent(self, node: VectorNode) -> None:
         assert isinstance(node.inst, comp.VectorComponent)
         # Evaluate instance object expressions
-        if isinstance(node.inst.width, ASTNode):
-            node.inst.width = node.inst.width.get_value()
+        # Attributes are typed by their elaborated value, but still hold an
+        # expression at this point
+        width = node.inst.width # type: Any
+        if isinstance(width, ASTNode):
+            node.inst.width = width.get_value()
             if node.inst.width == 0:
                 self.msg.fatal(
                     "Vector width must be greater than zero",
                     node.inst.inst_src_ref
                 )
 
-        if isinstance(node.inst.msb, ASTNode):
-            node.inst.msb = node.inst.msb.get_value()
+        msb = node.inst.msb # type: Any
+        if isinstance(msb, ASTNode):
+            node.inst.msb = msb.get_value()
 
-        if isinstance(node.inst.lsb, ASTNode):
-            node.inst.lsb = node.inst.lsb.get_value()
+        lsb = node.inst.lsb # type: Any
+        if isinstance(lsb, ASTNode):
+            node.inst.lsb = lsb.get_value()
 
 
 
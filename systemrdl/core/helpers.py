@@ -1,5 +1,6 @@
+import sys
 import textwrap
-from typing import Union, TYPE_CHECKING, Type, List
+from typing import Union, TYPE_CHECKING, Type, List, Dict
 
 from antlr4.Token import CommonToken
 from antlr4.tree.Tree import TerminalNodeImpl
@@ -34,9 +35,39 @@ def get_ID_text(token: Union[CommonToken, TerminalNodeImpl]) -> str:
     text = text.lstrip('\\')
     return text
 
+# Truncation masks, keyed by width.
+# Expressions are evaluated in a handful of distinct widths, so each mask is
+# only computed once rather than on every operation.
+_trunc_masks = {} # type: Dict[int, int]
+
+def get_trunc_mask(width: int) -> int:
+    """
+    Returns a mask of the lower 'width' bits
+    """
+    try:
+        return _trunc_masks[width]
+    except KeyError:
+        mask = _trunc_masks[width] = (1 << width) - 1
+        return mask
+
 def truncate_int(v: int, width: int) -> int:
-    mask = (1 << width) - 1
-    return v & mask
+    try:
+        return v & _trunc_masks[width]
+    except KeyError:
+        return v & get_trunc_mask(width)
+
+if sys.version_info >= (3, 10):
+    def parity(v: int) -> int:
+        """
+        Returns 1 if an odd number of bits are set in v
+        """
+        return v.bit_count() & 1
+else:
+    def parity(v: int) -> int:
+        """
+        Returns 1 if an odd number of bits are set in v
+        """
+        return bin(v).count("1") & 1
 
 def dedent_text(s: str) -> str:
     """
@@ -4,6 +4,7 @@ from .. import node as m_node
 from ..ast.ast_node import ASTNode
 from .. import rdltypes
 from ..ast.cast import AssignmentCast, is_castable
+from ..ast.folding import fold_constants
 from ..core.helpers import get_all_subclasses
 
 if TYPE_CHECKING:
@@ -101,6 +102,9 @@ class PropertyRule:
                     src_ref
                 )
 
+        if isinstance(value, ASTNode):
+            value = fold_constants(value)
+
         # If the property belongs to a mutex group, wipe out any of its
         # counterpart properties
         if self.mutex_group is not None:
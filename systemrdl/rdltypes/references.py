@@ -58,12 +58,14 @@ class ComponentRef:
                 # references are sane.
                 # Safe to expect this to be an AddressableNode
                 assert isinstance(current_node, AddressableNode)
+                array_dimensions = current_node.array_dimensions
+                assert array_dimensions is not None
 
-                for i, idx in enumerate(idx_list):
-                    if idx >= current_node.array_dimensions[i]:
+                for idx, dim in zip(idx_list, array_dimensions):
+                    if idx >= dim:
                         current_node.env.msg.fatal(
                             "Array index out of range. Expected 0-%d, got %d."
-                            % (current_node.array_dimensions[i]-1, idx),
+                            % (dim-1, idx),
                             name_src_ref
                         )
 
@@ -51,6 +51,11 @@ class TestEnums(RDLSourceTestCase):
         self.assertEqual(f6.get_property('reset'), int(f6.get_property('encode')['_order_']))
         self.assertEqual(f7.get_property('reset'), int(f7.get_property('encode')['_generate_next_value_']))
 
+        f_cond = root.find_by_path("enum_test1.reg3.f_cond")
+        f_cmp = root.find_by_path("enum_test1.reg3.f_cmp")
+        self.assertEqual(f_cond.width, 2)
+        self.assertEqual(f_cmp.width, 3)
+
         # Test enum properties
         self.assertTrue(bool(f_default_enum))
         self.assertEqual(len(f_default_enum), 5)
@@ -39,6 +39,13 @@ class TestErrors(RDLSourceTestCase):
             r"Instance array 'rf_array' has address stride 0x1, but the element size is 0x100"
         )
 
+    def test_ref_index_out_of_range(self):
+        self.assertRDLCompileError(
+            ["rdl_err_src/err_validate.rdl"],
+            "ref_index_out_of_range",
+            r"Array index out of range. Expected 0-1, got 2."
+        )
+
     def test_bad_addr_allocators(self):
         with self.subTest("addr"):
             self.assertRDLCompileError(
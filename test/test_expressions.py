@@ -1,8 +1,16 @@
+import copy
+
 from systemrdl import RDLCompiler
 
 from unittest_utils import RDLSourceTestCase
 
 import systemrdl.rdltypes as rdlt
+from systemrdl.ast import folding, fold_constants
+from systemrdl.ast import IntLiteral, BoolLiteral, StringLiteral, AssignmentCast
+from systemrdl.ast import ArrayLiteral, ArrayIndex, InstRef
+from systemrdl.ast import WidthCast, Add, RShift
+from systemrdl.messages import RDLCompileError
+from systemrdl.component import Field
 
 #===============================================================================
 class TestIntLiterals(RDLSourceTestCase):
@@ -38,6 +46,17 @@ class TestIntLiterals(RDLSourceTestCase):
         self.assertEqual((bool, True), self.eval_RDL_expr("(true)"))
         self.assertEqual((bool, False), self.eval_RDL_expr("(false)"))
 
+    def test_interning(self):
+        rdlc = RDLCompiler()
+        a = IntLiteral.get(rdlc.env, None, 8)
+        self.assertIs(a, IntLiteral.get(rdlc.env, None, 8))
+        self.assertIs(a, copy.deepcopy(a))
+        self.assertIsNot(a, IntLiteral.get(rdlc.env, None, 8, 32))
+
+        # Large values are not shared
+        b = IntLiteral.get(rdlc.env, None, 1234)
+        self.assertIsNot(b, IntLiteral.get(rdlc.env, None, 1234))
+
 #===============================================================================
 class TestStrLiteral(RDLSourceTestCase):
     def test_string(self):
@@ -200,6 +219,8 @@ class TestBinaryOperators(RDLSourceTestCase):
         self.assertEqual((int, 0x31), self.eval_RDL_expr("0x12 ^ 0x23"))
         self.assertEqual((int, 0xCE), self.eval_RDL_expr("8'h12 ~^ 8'h23"))
         self.assertEqual((int, 0xCE), self.eval_RDL_expr("8'h12 ^~ 8'h23"))
+        self.assertEqual((int, 2), self.eval_RDL_expr("true + 1"))
+        self.assertEqual((int, 0), self.eval_RDL_expr("true ^~ false"))
 
     def test_overflow(self):
         self.assertEqual((int, 1), self.eval_RDL_expr("8'hF0 + 5'h11"))
@@ -381,6 +402,11 @@ class TestReductionOperators(RDLSourceTestCase):
         self.assertEqual((int, 1), self.eval_RDL_expr("^8'h13"))
         self.assertEqual((int, 1), self.eval_RDL_expr("~^8'h12"))
         self.assertEqual((int, 0), self.eval_RDL_expr("~^8'h13"))
+        self.assertEqual((int, 1), self.eval_RDL_expr("&64'hFFFF_FFFF_FFFF_FFFF"))
+        self.assertEqual((int, 1), self.eval_RDL_expr("^64'hFFFF_FFFF_FFFF_FFFE"))
+        self.assertEqual((int, 0), self.eval_RDL_expr("~^64'hFFFF_FFFF_FFFF_FFFE"))
+        self.assertEqual((int, 1), self.eval_RDL_expr("&(~8'h00)"))
+        self.assertEqual((int, 1), self.eval_RDL_expr("^(-8'h03)"))
         self.assertEqual((bool, False), self.eval_RDL_expr("!true"))
         self.assertEqual((bool, True), self.eval_RDL_expr("!false"))
         self.assertEqual((bool, False), self.eval_RDL_expr("!8'h10"))
@@ -438,6 +464,14 @@ class TestBooleanOperators(RDLSourceTestCase):
         self.assertEqual((bool, True), self.eval_RDL_expr("0xF || 0x0"))
         self.assertEqual((bool, True), self.eval_RDL_expr("0xF || 0xF0"))
 
+    def test_short_circuit(self):
+        # Right operand is not evaluated if the left operand decides the result
+        self.assertEqual((bool, False), self.eval_RDL_expr("false && (1 / 0 == 0)"))
+        self.assertEqual((bool, True), self.eval_RDL_expr("true || (1 / 0 == 0)"))
+
+        # Also when folded at the definition
+        _, expr = self.parse_RDL_expr("false && (1 / 0 == 0)")
+        self.assertFalse(fold_constants(expr).get_value())
 
     def test_err(self):
         self.assertRDLExprError('10 && "hi"', "Right operand of expression is not a compatible boolean type")
@@ -556,6 +590,16 @@ class TestTernaryOperator(RDLSourceTestCase):
         self.assertEqual((rdlt.ArrayedType(str), ['foo','bar']), self.eval_RDL_expr('true ? \'{"foo", "bar"} : \'{"baz"}'))
         self.assertEqual((rdlt.ArrayedType(str), ['baz']), self.eval_RDL_expr('false ? \'{"foo", "bar"} : \'{"baz"}'))
 
+    def test_short_circuit(self):
+        # Only the selected operand is evaluated
+        self.assertEqual((int, 5), self.eval_RDL_expr("false ? 1 / 0 : 5"))
+        self.assertEqual((int, 5), self.eval_RDL_expr("true ? 5 : 1 % 0"))
+        self.assertEqual((int, 0x10), self.eval_RDL_expr("(false ? 8'hFF : 4'h1) + 4'hF"))
+
+        # Also when folded at the definition
+        _, expr = self.parse_RDL_expr("true ? 5 : 1 % 0")
+        self.assertEqual(fold_constants(expr).get_value(), 5)
+
     def test_right_associative(self):
         # A ? B : C ? D : E
         # Right assoc: A ? B : (C ? D : E)
@@ -612,6 +656,28 @@ class TestCast(RDLSourceTestCase):
         self.assertEqual((int, 0x00FE), self.eval_RDL_expr("(8)'(1 - 3)"))
         self.assertEqual((int, 0xABCD1234DEADBEEF), self.eval_RDL_expr("longint'(68'hF_ABCD1234_DEADBEEF)"))
 
+    def test_static_width_cast(self):
+        _, expr = self.parse_RDL_expr("longint'(68'hF_ABCD1234_DEADBEEF)")
+        self.assertEqual(expr.get_value(), 0xABCD1234DEADBEEF)
+        self.assertEqual(expr.get_value(), 0xABCD1234DEADBEEF)
+        self.assertEqual(expr.get_min_eval_width(), 64)
+
+        env = expr.env
+        with self.assertRaisesRegex(RDLCompileError, "Cannot cast to width of zero"):
+            WidthCast.from_width(env, None, IntLiteral(env, None, 1), 0)
+
+        # Copies re-evaluate the width of the value operand
+        v = RShift(env, None,
+            Add(env, None, IntLiteral(env, None, 0xFF, 8), IntLiteral(env, None, 1, 8)),
+            IntLiteral(env, None, 1)
+        )
+        expr = WidthCast.from_width(env, None, v, 8)
+        self.assertEqual(expr.get_value(), 0x00)
+        expr_copy = copy.deepcopy(expr)
+        expr_copy.v.l.r = IntLiteral(env, None, 1, 16)
+        self.assertEqual(expr_copy.get_value(), 0x80)
+        self.assertEqual(expr.get_value(), 0x00)
+
     def test_bool_cast(self):
         self.assertEqual((bool, True), self.eval_RDL_expr("boolean'(0x10)"))
         self.assertEqual((bool, False), self.eval_RDL_expr("boolean'(0x0)"))
@@ -682,7 +748,176 @@ class TestAdvanced(RDLSourceTestCase):
         self.assertEqual((int, 0x0000), self.eval_RDL_expr("(|(~(4'hF))) + 8'b0"))
         self.assertEqual((int, 0x00FF), self.eval_RDL_expr("(~(&(4'b1))) + 8'b0"))
 
+    def test_deepcopy(self):
+        _, expr = self.parse_RDL_expr("{2{4'hA + 4'h1, 8'hFF}} + 1234")
+        expr_copy = copy.deepcopy(expr)
+        self.assertIsNot(expr_copy, expr)
+        self.assertIsNot(expr_copy.l, expr.l)
+        self.assertEqual(expr_copy.get_value(), expr.get_value())
+
+        # Literals are immutable and are shared
+        self.assertIs(expr_copy.r, expr.r)
+
+        # Environment is copied by reference
+        self.assertIs(expr_copy.env, expr.env)
+        self.assertIs(expr_copy.l.msg, expr.l.msg)
+
     def test_error(self):
         with self.assertRaises(ValueError):
             rdlc = RDLCompiler()
             rdlc.eval("2abcd")
+
+#===============================================================================
+class TestInstRef(RDLSourceTestCase):
+    def setUp(self):
+        super().setUp()
+        self.root = self.compile(
+            ["rdl_src/references_direct_lhs.rdl"],
+            "top"
+        )
+        self.top_def = self.root.top.inst.original_def
+
+    def test_constant_index(self):
+        env = self.root.env
+        ref = InstRef(env, self.top_def, [
+            ("reg2", [IntLiteral(env, None, 1)], None),
+            ("x", [], None),
+        ])
+        self.assertIs(ref.predict_type(), Field)
+        self.assertIs(ref.predict_type(), Field)
+
+        node = ref.get_value().build_node_ref(self.root.top)
+        self.assertEqual(node.get_path(), "top.reg2[1].x")
+
+        # Reference does not change, so it is resolved only once
+        self.assertIs(ref.get_value(), ref.get_value())
+
+    def test_variable_index(self):
+        env = self.root.env
+        array = ArrayLiteral(env, None, [IntLiteral(env, None, 0), IntLiteral(env, None, 1)])
+        ref = InstRef(env, self.top_def, [
+            ("reg2", [ArrayIndex(env, None, array, IntLiteral(env, None, 1))], None),
+            ("x", [], None),
+        ])
+        self.assertIs(ref.predict_type(), Field)
+
+        node = ref.get_value().build_node_ref(self.root.top)
+        self.assertEqual(node.get_path(), "top.reg2[1].x")
+
+        array.elements[1] = IntLiteral(env, None, 0)
+        node = ref.get_value().build_node_ref(self.root.top)
+        self.assertEqual(node.get_path(), "top.reg2[0].x")
+
+    def test_deepcopy(self):
+        env = self.root.env
+        array = ArrayLiteral(env, None, [IntLiteral(env, None, 0), IntLiteral(env, None, 1)])
+        ref = InstRef(env, self.top_def, [
+            ("reg2", [ArrayIndex(env, None, array, IntLiteral(env, None, 1))], None),
+            ("x", [], None),
+        ])
+        ref.get_value()
+        ref_copy = copy.deepcopy(ref)
+        self.assertIs(ref_copy.ref_root, self.top_def)
+
+        node = ref_copy.get_value().build_node_ref(self.root.top)
+        self.assertEqual(node.get_path(), "top.reg2[1].x")
+
+        # Index expressions of the copy are independent of the original
+        array.elements[1] = IntLiteral(env, None, 0)
+        node = ref_copy.get_value().build_node_ref(self.root.top)
+        self.assertEqual(node.get_path(), "top.reg2[1].x")
+        node = ref.get_value().build_node_ref(self.root.top)
+        self.assertEqual(node.get_path(), "top.reg2[0].x")
+
+#===============================================================================
+class TestConstantFolding(RDLSourceTestCase):
+    def assertFoldMatches(self, expr_text):
+        _, expr = self.parse_RDL_expr(expr_text)
+        expected = expr.get_value()
+        _, expr = self.parse_RDL_expr(expr_text)
+        folded = fold_constants(expr)
+        result = folded.get_value()
+        self.assertEqual((type(expected), expected), (type(result), result))
+        return folded
+
+    def test_literals(self):
+        self.assertIsInstance(self.assertFoldMatches("(1 + 2) * 3"), IntLiteral)
+        self.assertIsInstance(self.assertFoldMatches("8'hFF + 8'h1 == 0"), BoolLiteral)
+        self.assertIsInstance(self.assertFoldMatches('true ? "foo" : "bar"'), StringLiteral)
+        self.assertIsInstance(self.assertFoldMatches("{3{4'hF}}"), IntLiteral)
+
+    def test_width_propagation(self):
+        exprs = [
+            "(8'h00 - 1'h1) + 16'h1",
+            "(~(~(8'h00 - 1'h1))) + 16'h0",
+            "((8'hFF + 8'h1)) + ((8'hFF + 8'h1) + 16'b0)",
+            "(4'hF + 4'h1) == 8'h10",
+            "(true ? 4'hF : 8'h0) + 4'h1",
+            "(false ? 4'hF : 8'h0) + 4'h1",
+            "{4'hF + 4'h1, 4'h0}",
+            "(4)'(4'hF + 4'h1) + 8'h0",
+            "(1'b1 << (2 + 1)) + 8'b0",
+        ]
+        for expr_text in exprs:
+            with self.subTest(expr_text):
+                folded = self.assertFoldMatches(expr_text)
+                self.assertIsInstance(folded, (IntLiteral, BoolLiteral))
+                _, expr = self.parse_RDL_expr(expr_text)
+                self.assertEqual(folded.get_min_eval_width(), expr.get_min_eval_width())
+
+    def test_numeric_conditional(self):
+        # Numeric conditionals with boolean operands keep their integer width
+        exprs = [
+            ("!(&((2'd1 % 42) ? (boolean'(4'd4)) : ({8'd102, 2'd1})))", True),
+            ("~^(~({(64'd34 ? (boolean'(3'd3)) : 8'd60), 16'd190}))", 0),
+            ("(((1?3:5)'(47)) ? (16'(32'd5)) : (boolean'(64'd103))) - 16'd6", 65535),
+            ("{(true ? boolean'(1) : 8'd0), 8'd0}", 256),
+            ("&(false ? 4'd0 : boolean'(1))", 0),
+        ]
+        for expr_text, expected in exprs:
+            with self.subTest(expr_text):
+                self.assertEqual(self.eval_RDL_expr(expr_text)[1], expected)
+                self.assertFoldMatches(expr_text)
+
+                pred_type, expr = self.parse_RDL_expr(expr_text)
+                expr = fold_constants(AssignmentCast(expr.env, None, expr, pred_type))
+                self.assertEqual(expr.get_value(), expected)
+
+        folded = self.assertFoldMatches("true ? boolean'(1) : 8'd0")
+        self.assertIsInstance(folded, IntLiteral)
+        self.assertEqual(folded.get_min_eval_width(), 8)
+
+        # Literal kind follows the node's type rather than the value's
+        _, expr = self.parse_RDL_expr("true ? 4'd1 : 8'd0")
+        literal = folding.literal_from_value(expr, True)
+        self.assertIsInstance(literal, IntLiteral)
+        self.assertEqual((literal.get_value(), literal.get_min_eval_width()), (1, 8))
+
+    def test_impure(self):
+        # Aggregate values cannot be represented as a literal
+        _, expr = self.parse_RDL_expr("true ? '{1,2} : '{3,4}")
+        folded = fold_constants(expr)
+        self.assertEqual(folded.get_value(), [1, 2])
+
+    def test_definition(self):
+        # Expressions are folded where they are defined, so every instance
+        # shares the folded tree
+        root = self.compile(
+            ["rdl_src/constant_folding.rdl"],
+            "constant_folding"
+        )
+        top_def = root.top.inst.original_def
+        self.assertIsInstance(top_def.parameters[0].expr, IntLiteral)
+
+        f = root.find_by_path("constant_folding.r1.f")
+        self.assertEqual(f.width, 4)
+        self.assertEqual(f.get_property('reset'), 0x4)
+
+        root = self.compile(
+            ["rdl_src/constant_folding.rdl"],
+            "constant_folding",
+            parameters={"WIDTH": 12}
+        )
+        f = root.find_by_path("constant_folding.r1.f")
+        self.assertEqual(f.width, 8)
+        self.assertEqual(f.get_property('reset'), 0x4)
@@ -42,7 +42,7 @@ class RDLSourceTestCase(unittest.TestCase):
         return rdlc.elaborate(top_name, inst_name, parameters)
 
 
-    def eval_RDL_expr(self, expr_text):
+    def parse_RDL_expr(self, expr_text):
         input_stream = InputStream(expr_text)
 
         rdlc = RDLCompiler(message_printer=TestPrinter())
@@ -57,6 +57,11 @@ class RDLSourceTestCase(unittest.TestCase):
         result = visitor.visit(tree)
 
         pred_type = result.predict_type()
+        return pred_type, result
+
+
+    def eval_RDL_expr(self, expr_text):
+        pred_type, result = self.parse_RDL_expr(expr_text)
         return pred_type, result.get_value()
 
 